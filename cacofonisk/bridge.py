@@ -53,8 +53,5 @@ class BridgeDict(dict):
     A dict which raises a MissingBridgeUniqueid exception if a key is missing.
     """
 
-    def __getitem__(self, item):
-        try:
-            return super(BridgeDict, self).__getitem__(item)
-        except KeyError:
-            raise MissingBridgeUniqueid(item)
+    def __missing__(self, key):
+        raise MissingBridgeUniqueid(key)
@@ -11,9 +11,10 @@ class CallerId(namedtuple('CallerIdBase', 'name num')):
 
     Usage::
 
-        caller = CallerId(name='My name', number='+311234567', is_public=True)
-        caller = caller.replace(code=123456789)
+        caller = CallerId(name='My name', num='+311234567')
+        caller = caller.replace(num='+311234568')
     """
+    __slots__ = ()
 
     def __new__(cls, name='', num=''):
         if name == '<unknown>':
@@ -29,10 +30,11 @@ class CallerId(namedtuple('CallerIdBase', 'name num')):
         Create a copy of this CallerId with specified changes.
 
         Args:
-            **kwargs: One or more of code, name, number, is_public.
+            **kwargs: One or more of name, num.
 
         Returns:
-            CallerId: A new instance with replaced values.
+            CallerId: A new instance with replaced values, or this instance
+                if none of the values change.
         """
         if 'name' in kwargs and kwargs['name'] == '<unknown>':
             kwargs['name'] = ''
@@ -40,4 +42,10 @@ class CallerId(namedtuple('CallerIdBase', 'name num')):
         if 'num' in kwargs and kwargs['num'] == '<unknown>':
             kwargs['num'] = ''
 
+        if all(
+                key in self._fields and getattr(self, key) == value
+                for key, value in kwargs.items()
+        ):
+            return self
+
         return self._replace(**kwargs)
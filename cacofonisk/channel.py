@@ -1,12 +1,36 @@
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
+from operator import attrgetter
 
 from cacofonisk.callerid import CallerId
 
 
+# Most channels are created without caller ID information. CallerId is
+# immutable, so those channels can all share a single empty instance.
+_EMPTY_CALLER_ID = CallerId()
+
+
 class MissingUniqueid(KeyError):
     pass
 
 
+def _new_caller_id(name, num):
+    """
+    Get a CallerId for the name and number of a Newchannel event.
+
+    Args:
+        name (str): The caller ID name, possibly '<unknown>'.
+        num (str): The caller ID number, possibly '<unknown>'.
+
+    Returns:
+        CallerId: The shared _EMPTY_CALLER_ID if both are unknown, a new
+            CallerId otherwise.
+    """
+    if name == '<unknown>' and num == '<unknown>':
+        return _EMPTY_CALLER_ID
+
+    return CallerId(name=name, num=num)
+
+
 class Channel(object):
     """
     A Channel holds Asterisk channel state.
@@ -29,21 +53,20 @@ class Channel(object):
         self.exten = event['Exten']
         self.account_code = event['AccountCode']
         self.cid_calling_pres = None
-        self.caller_id = CallerId(
-            name=event['CallerIDName'],
-            num=event['CallerIDNum'],
-        )
-        self.connected_line = CallerId(
-            name=event['ConnectedLineName'],
-            num=event['ConnectedLineNum'],
-        )
+        self.caller_id = _new_caller_id(
+            event['CallerIDName'], event['CallerIDNum'])
+        self.connected_line = _new_caller_id(
+            event['ConnectedLineName'], event['ConnectedLineNum'])
 
         # Create vars which are used to store generated data based on other
         # events from Asterisk.
         self.fwd_local_bridge = None
         self.back_local_bridge = None
         self.back_dial = None
-        self.fwd_dials = []
+        # The channels being dialed by this channel, in the order in which
+        # they were dialed. Only the keys are used; an OrderedDict keeps the
+        # dial order while allowing O(1) removal.
+        self.fwd_dials = OrderedDict()
         self.bridge = None
         self.is_originated = False
         self.is_calling = self.uniqueid == self.linkedid
@@ -51,6 +74,9 @@ class Channel(object):
         # The Custom dict can be used to store custom data.
         self.custom = {}
 
+        # The last SimpleChannel returned by as_namedtuple.
+        self._simple_channel = None
+
     def __repr__(self):
         return (
             '<Channel('
@@ -66,6 +92,27 @@ class Channel(object):
             next=(self.fwd_local_bridge and self.fwd_local_bridge.name),
             prev=(self.back_local_bridge and self.back_local_bridge.name))
 
+    @property
+    def name(self):
+        """
+        The name of the channel, e.g. 'SIP/150010001-00000004'.
+
+        Returns:
+            str: The channel name.
+        """
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        """
+        Set the channel name and update the values derived from it.
+
+        Args:
+            name (str): The new channel name.
+        """
+        self._name = name
+        self._is_local = name.startswith('Local/')
+
     @property
     def is_local(self):
         """
@@ -78,7 +125,7 @@ class Channel(object):
         Returns:
             bool: True if the channel is local, false otherwise.
         """
-        return self.name.startswith('Local/')
+        return self._is_local
 
     @property
     def has_extension(self):
@@ -107,23 +154,29 @@ class Channel(object):
 
         Returns:
             Channel: The master channel dialing this channel.
+
+        Raises:
+            AssertionError: If the dials and local bridges form a loop.
         """
-        if self.back_dial:
-            # Check if we are being dialed.
-            a_chan = self.back_dial
-        else:
-            # This is the root channel.
-            a_chan = None
-
-        # If our a_chan has a local bridge, use the back part of that bridge
-        # to check for further dials.
-        if a_chan and a_chan.back_local_bridge:
-            a_chan = a_chan.back_local_bridge
-
-        # If we have an incoming channel, recurse through the channels to find
-        # the true origin channel. If we don't have one, it means we're the
-        # origin channel.
-        return a_chan.get_dialing_channel() if a_chan else self
+        a_chan = self
+        visited = {self}
+
+        # Follow the dials back to the channel which started the call. If
+        # a dialing channel has a local bridge, use the back part of that
+        # bridge to check for further dials.
+        while a_chan.back_dial:
+            a_chan = a_chan.back_dial
+
+            if a_chan.back_local_bridge:
+                a_chan = a_chan.back_local_bridge
+
+            if a_chan in visited:
+                raise AssertionError(
+                    'Dials of {!r} loop back to {!r}'.format(self, a_chan))
+
+            visited.add(a_chan)
+
+        return a_chan
 
     def get_dialed_channels(self):
         """
@@ -135,38 +188,42 @@ class Channel(object):
 
         It works like this:
 
-        * A-channel (this) has a list of _fwd_dials items (open
-          dials).
-        * We loop over those (a list of uniqueids) and find the
-          corresponding channels.
+        * A-channel (this) has an ordered mapping of fwd_dials items
+          (open dials), keyed by the dialed channels.
+        * We loop over those channels.
         * Those channels may be SIP channels, or they can be local
-          channels, in which case we have to look further (by calling
-          this function on those channels).
+          channels, in which case we have to look further (by looping
+          over the open dials of the other side of the local bridge).
 
         Returns:
             set: A set of all channels being dialed by this channel.
         """
         b_channels = set()
-
-        b_chans = self.fwd_dials
-
-        for b_chan in b_chans:
-            # Likely, b_chan.fwd_local_bridge is None, in which case we're
-            # looking at a real tech channel (non-Local).
-            # Or, the b_chan has one.fwd_local_bridge, after which we have
-            # to call this function again.
-            if b_chan.fwd_local_bridge:
-                b_chan = b_chan.fwd_local_bridge
-
-                assert not b_chan.fwd_local_bridge, (
-                    'Since when does asterisk do double links? b_chan={!r}'
-                    .format(b_chan)
-                )
-
-                b_channels.update(b_chan.get_dialed_channels())
-            else:
-                assert not b_chan.fwd_dials
-                b_channels.add(b_chan)
+        visited = {self}
+        pending = [self]
+
+        while pending:
+            a_chan = pending.pop()
+
+            for b_chan in a_chan.fwd_dials:
+                # Likely, b_chan.fwd_local_bridge is None, in which case
+                # we're looking at a real tech channel (non-Local).
+                # Or, the b_chan has one.fwd_local_bridge, after which we
+                # have to look at the dials of that channel as well.
+                if b_chan.fwd_local_bridge:
+                    b_chan = b_chan.fwd_local_bridge
+
+                    assert not b_chan.fwd_local_bridge, (
+                        'Since when does asterisk do double links? '
+                        'b_chan={!r}'.format(b_chan)
+                    )
+
+                    if b_chan not in visited:
+                        visited.add(b_chan)
+                        pending.append(b_chan)
+                else:
+                    assert not b_chan.fwd_dials
+                    b_channels.add(b_chan)
 
         return b_channels
 
@@ -174,62 +231,48 @@ class Channel(object):
         """
         Traverse (local) bridges recursively and get all non-Local channels.
 
-        Uses _get_peers_recursive to traverse the local and non-local
-        bridges recursively, but also checks the local bridges of self for
-        more channels.
-
-        This cannot be done in one step, as doing so would cause a recursion
-        loop while traversing the same local bridge back and forth.
+        Starting from this channel and both sides of its local bridge, this
+        walks the bridges the channels are in. Local channels in those
+        bridges are followed through their own local bridge to the next
+        bridge. Every channel is visited at most once, which prevents loops
+        while traversing the same local bridge back and forth.
 
         Returns:
             set: A set of non-local Channels.
         """
-        peers = self._bridge_peers_recurse()
+        peers = set()
+        visited = set()
+        pending = [self]
 
         if self.fwd_local_bridge:
-            fwd_peers = self.fwd_local_bridge._bridge_peers_recurse()
-            for peer in fwd_peers:
-                peers.add(peer)
+            pending.append(self.fwd_local_bridge)
 
         if self.back_local_bridge:
-            back_peers = self.back_local_bridge._bridge_peers_recurse()
-            for peer in back_peers:
-                peers.add(peer)
-
-        return peers
+            pending.append(self.back_local_bridge)
 
-    def _bridge_peers_recurse(self):
-        """
-        The recursive step of get_bridge_peers_recursive.
-
-        This function finds the non-Local channels of the current bridge,
-        as well as the non-Local channels of the channels linked through
-        local bridges.
-
-        Returns:
-            set: A set of non-local Channels.
-        """
-        if not self.bridge:
-            return set()
+        while pending:
+            channel = pending.pop()
 
-        peers = set()
+            if channel in visited:
+                continue
 
-        if not self.is_local:
-            peers.add(self)
+            visited.add(channel)
 
-        for peer in [peer for peer in self.bridge.peers if peer != self]:
-            if not peer.is_local:
-                peers.add(peer)
-            elif peer.is_local and peer.fwd_local_bridge:
-                rec_peers = peer.fwd_local_bridge._bridge_peers_recurse()
+            if not channel.bridge:
+                continue
 
-                for recursive_peer in rec_peers:
-                    peers.add(recursive_peer)
-            elif peer.is_local and peer.back_local_bridge:
-                rec_peers = peer.back_local_bridge._bridge_peers_recurse()
+            if not channel.is_local:
+                peers.add(channel)
 
-                for recursive_peer in rec_peers:
-                    peers.add(recursive_peer)
+            for peer in channel.bridge.peers:
+                if peer is channel:
+                    continue
+                elif not peer.is_local:
+                    peers.add(peer)
+                elif peer.fwd_local_bridge:
+                    pending.append(peer.fwd_local_bridge)
+                elif peer.back_local_bridge:
+                    pending.append(peer.back_local_bridge)
 
         return peers
 
@@ -237,13 +280,18 @@ class Channel(object):
         """
         Convert Channel to a SimpleChannel, so it's safe to pass to a reporter.
 
+        The SimpleChannel is reused as long as none of its fields changed,
+        so reporting the same channel repeatedly does not allocate.
+
         Returns:
             SimpleChannel: A SimpleChannel with the data of this channel.
         """
-        fields = SimpleChannel._fields
+        values = _get_simple_channel_values(self)
+
+        if self._simple_channel != values:
+            self._simple_channel = SimpleChannel._make(values)
 
-        return SimpleChannel(
-            **{field: getattr(self, field) for field in fields})
+        return self._simple_channel
 
 
 class ChannelDict(dict):
@@ -251,17 +299,16 @@ class ChannelDict(dict):
     ChannelDict is a dict which raises a MissingUniqueid if the key is missing.
     """
 
-    def __getitem__(self, item):
-        try:
-            return super(ChannelDict, self).__getitem__(item)
-        except KeyError:
-            raise MissingUniqueid(item)
+    def __missing__(self, key):
+        raise MissingUniqueid(key)
 
 
 class SimpleChannel(namedtuple(
     'SimpleChannelBase', 'name uniqueid linkedid account_code caller_id '
                          'cid_calling_pres connected_line exten state'
 )):
+    __slots__ = ()
+
     def replace(self, **kwargs):
         """
         Make the _replace method public.
@@ -273,3 +320,6 @@ class SimpleChannel(namedtuple(
             A new instance of SimpleChannel.
         """
         return self._replace(**kwargs)
+
+
+_get_simple_channel_values = attrgetter(*SimpleChannel._fields)
@@ -7,6 +7,22 @@ from .constants import (AST_CAUSE_ANSWERED_ELSEWHERE, AST_CAUSE_CALL_REJECTED,
                         AST_CAUSE_NO_USER_RESPONSE, AST_CAUSE_UNKNOWN,
                         AST_CAUSE_USER_BUSY, AST_STATE_DIALING, AST_STATE_DOWN,
                         AST_STATE_RING, AST_STATE_RINGING, AST_STATE_UP)
+from .reporters import BaseReporter
+
+
+def _is_noop_hook(reporter, name):
+    """
+    Check whether a reporter hook is the empty BaseReporter implementation.
+
+    Args:
+        reporter (Reporter): The reporter to inspect.
+        name (str): The name of the hook, e.g. 'on_event'.
+
+    Returns:
+        bool: True if calling the hook would not do anything.
+    """
+    hook = getattr(reporter, name, None)
+    return getattr(hook, '__func__', None) is getattr(BaseReporter, name)
 
 
 class EventHandler(object):
@@ -44,11 +60,23 @@ class EventHandler(object):
             reporter (Reporter): A reporter to send events to.
         """
         self._reporter = reporter
+        self._reports_events = not _is_noop_hook(reporter, 'on_event')
+        self._reports_b_dial = not _is_noop_hook(reporter, 'on_b_dial')
+        self._reports_blind_transfer = not _is_noop_hook(
+            reporter, 'on_blind_transfer')
         self._channels = ChannelDict()
         self._bridges = BridgeDict()
         self._logger = logger or logging.getLogger(__name__)
         self._hostname = hostname
 
+        # Build the event name to handler mapping once, so dispatching an
+        # event is a single dict lookup.
+        self._event_handlers = {
+            event_name: handler
+            for event_name, handler in self.event_handlers().items()
+            if handler
+        }
+
     @classmethod
     def event_handlers(cls):
         """
@@ -96,24 +124,25 @@ class EventHandler(object):
             event (dict): A dictionary containing an AMI event.
         """
         try:
-            handlers = self.event_handlers()
-            if event['Event'] in handlers and handlers[event['Event']]:
-                handlers[event['Event']](self, event)
+            handler = self._event_handlers.get(event['Event'])
+            if handler:
+                handler(self, event)
 
         except MissingUniqueid as e:
             # If this is after a recent FullyBooted and/or start of
             # self, it is reasonable to expect that certain events will
             # fail.
             self._logger.warning(
-                'Channel with Uniqueid {} not in mem when processing event: '
-                '{!r}'.format(e.args[0], event))
+                'Channel with Uniqueid %s not in mem when processing event: '
+                '%r', e.args[0], event)
         except MissingBridgeUniqueid as e:
             # This too is reasonably expected.
             self._logger.warning(
-                'Bridge with Uniqueid {} not in mem when processing event: '
-                '{!r}'.format(e.args[0], event))
+                'Bridge with Uniqueid %s not in mem when processing event: '
+                '%r', e.args[0], event)
 
-        self._reporter.on_event(event)
+        if self._reports_events:
+            self._reporter.on_event(event)
 
     def _on_queue_caller_abandon(self, event):
         """
@@ -132,17 +161,17 @@ class EventHandler(object):
         Args:
             event (dict): A FullyBooted event.
         """
-        self._logger.info('Connection established to Asterisk on {}'.format(
-            self._hostname))
+        self._logger.info(
+            'Connection established to Asterisk on %s', self._hostname)
 
         if len(self._bridges) > 0:
-            self._logger.warning('Bridge buffers not empty! Flushing {} '
-                                 'bridges.'.format(len(self._bridges)))
+            self._logger.warning('Bridge buffers not empty! Flushing %d '
+                                 'bridges.', len(self._bridges))
             self._bridges = BridgeDict()
 
         if len(self._channels) > 0:
-            self._logger.warning('Channel buffers not empty! Flushing {} '
-                                 'channels.'.format(len(self._channels)))
+            self._logger.warning('Channel buffers not empty! Flushing %d '
+                                 'channels.', len(self._channels))
             self._channels = ChannelDict()
 
     def _on_new_channel(self, event):
@@ -187,8 +216,9 @@ class EventHandler(object):
         Args:
             event (dict): A LocalBridge event.
         """
-        local_one = self._channels[event['LocalOneUniqueid']]
-        local_two = self._channels[event['LocalTwoUniqueid']]
+        channels = self._channels
+        local_one = channels[event['LocalOneUniqueid']]
+        local_two = channels[event['LocalTwoUniqueid']]
 
         assert local_one.fwd_local_bridge is None
         assert local_one.back_local_bridge is None
@@ -205,7 +235,8 @@ class EventHandler(object):
         Args:
             event (dict): A Hangup event.
         """
-        channel = self._channels[event['Uniqueid']]
+        channels = self._channels
+        channel = channels[event['Uniqueid']]
 
         self.on_hangup(channel, event)
 
@@ -216,11 +247,19 @@ class EventHandler(object):
         if channel.back_local_bridge:
             channel.back_local_bridge.fwd_local_bridge = None
 
+        # Normally a DialEnd has already done this, but make sure no open
+        # dial keeps referring to a channel which no longer exists.
+        if channel.back_dial:
+            channel.back_dial.fwd_dials.pop(channel, None)
+
+        for destination in channel.fwd_dials:
+            destination.back_dial = None
+
         # Remove the channel from our own list.
-        del self._channels[channel.uniqueid]
+        del channels[channel.uniqueid]
 
         # If we don't have any channels, check if we're completely clean.
-        if not len(self._channels):
+        if not channels:
             self._logger.info('(no channels left)')
 
     def _on_dial_begin(self, event):
@@ -238,33 +277,36 @@ class EventHandler(object):
         Args:
             event (dict): A DialBegin event.
         """
-        if 'DestUniqueid' in event:
-            if 'Uniqueid' in event:
-                # This is a dial between two channels. So let's link them
-                # together.
-                channel = self._channels[event['Uniqueid']]
-                destination = self._channels[event['DestUniqueid']]
-                channel.is_calling = True
+        if 'DestUniqueid' not in event:
+            raise AssertionError(
+                'A DialBegin event was generated without DestUniqueid: '
+                '{}'.format(event))
 
-                # Verify target is not being dialed already.
-                assert not destination.back_dial
+        channels = self._channels
 
-                # _fwd_dials is a list of channels being dialed by A.
-                channel.fwd_dials.append(destination)
+        if 'Uniqueid' not in event:
+            # The dial has a destination but not source. That means this
+            # Dial was created by an Originate.
+            destination = channels[event['DestUniqueid']]
+            destination.is_originated = True
+            return
 
-                # _back_dial is the channel dialing B.
-                destination.back_dial = channel
+        # This is a dial between two channels. So let's link them together.
+        channel = channels[event['Uniqueid']]
+        destination = channels[event['DestUniqueid']]
+        channel.is_calling = True
 
-                self.on_dial_begin(channel, destination)
-            else:
-                # The dial has a destination but not source. That means this
-                # Dial was created by an Originate.
-                destination = self._channels[event['DestUniqueid']]
-                destination.is_originated = True
-        else:
-            raise AssertionError(
-                'A DialBegin event was generated without DestUniqueid: '
-                '{}'.format(event))
+        # Verify target is not being dialed already.
+        assert not destination.back_dial
+        assert destination not in channel.fwd_dials
+
+        # fwd_dials holds the channels being dialed by A, in dial order.
+        channel.fwd_dials[destination] = None
+
+        # back_dial is the channel dialing B.
+        destination.back_dial = channel
+
+        self.on_dial_begin(channel, destination)
 
     def _on_dial_end(self, event):
         """
@@ -281,13 +323,12 @@ class EventHandler(object):
         # Check if we have a source and destination channel to pull
         # apart. Originate creates Dials without source.
         if 'Uniqueid' in event and 'DestUniqueid' in event:
-            channel = self._channels[event['Uniqueid']]
-            destination = self._channels[event['DestUniqueid']]
+            channels = self._channels
+            channel = channels[event['Uniqueid']]
+            destination = channels[event['DestUniqueid']]
 
             destination.back_dial = None
-
-            if destination in channel.fwd_dials:
-                channel.fwd_dials.remove(destination)
+            channel.fwd_dials.pop(destination, None)
         else:
             # Dials without Uniqueid and DestUniqueid can occur, but we
             # can't/don't handle them.
@@ -371,8 +412,14 @@ class EventHandler(object):
         Args:
             event (dict): A BridgeDestroy event.
         """
-        assert len(self._bridges[event['BridgeUniqueid']]) is 0
-        del self._bridges[event['BridgeUniqueid']]
+        bridges = self._bridges
+        bridge_uniqueid = event['BridgeUniqueid']
+
+        # Look the bridge up outside of the assert, so a missing bridge is
+        # reported as MissingBridgeUniqueid when running with -O too.
+        bridge = bridges[bridge_uniqueid]
+        assert len(bridge) == 0
+        del bridges[bridge_uniqueid]
 
     def _on_new_callerid(self, event):
         """
@@ -478,7 +525,7 @@ class EventHandler(object):
             channel (Channel): The channel initiating the dial.
             destination (Channel): The channel being dialed.
         """
-        if not destination.is_local and destination.state == 5:
+        if destination.state == AST_STATE_RINGING and not destination.is_local:
             self.on_b_dial_ringing(destination)
 
     def on_b_dial_ringing(self, channel):
@@ -518,11 +565,12 @@ class EventHandler(object):
                 if target != channel:
                     target.custom['ignore_b_dial'] = True
 
-            self._reporter.on_blind_transfer(
-                caller=a_chan.as_namedtuple(),
-                transferer=transferer.as_namedtuple(),
-                targets=[chan.as_namedtuple() for chan in target_chans],
-            )
+            if self._reports_blind_transfer:
+                self._reporter.on_blind_transfer(
+                    caller=a_chan.as_namedtuple(),
+                    transferer=transferer.as_namedtuple(),
+                    targets=[chan.as_namedtuple() for chan in target_chans],
+                )
         elif (
                 a_chan.is_originated and
                 a_chan.fwd_dials and a_chan.fwd_local_bridge
@@ -537,19 +585,26 @@ class EventHandler(object):
             # the called party.
             originating_chan = a_chan
             a_bridge = originating_chan.fwd_local_bridge.bridge
-            a_chan = [peer for peer in a_bridge.peers
-                      if not peer.is_local][0]
+            a_chan = next(
+                (peer for peer in a_bridge.peers if not peer.is_local), None)
 
-            if not a_chan.is_local:
-                called_exten = originating_chan.fwd_dials[0].exten
-                a_chan.exten = called_exten
-                a_chan.is_calling = True
+            if a_chan is None:
+                self._logger.error(
+                    'Caller (Originate) bridge has no non-Local channels: '
+                    '%r', a_bridge)
+                return
 
-                if not a_chan.has_extension:
-                    self._logger.error(
-                        'Caller (Originate) did not have an extension: '
-                        '{}'.format(channel))
+            # Use the first open dial, like Asterisk dialed it.
+            called_exten = next(iter(originating_chan.fwd_dials)).exten
+            a_chan.exten = called_exten
+            a_chan.is_calling = True
 
+            if not a_chan.has_extension:
+                self._logger.error(
+                    'Caller (Originate) did not have an extension: '
+                    '%s', channel)
+
+            if self._reports_b_dial:
                 self._reporter.on_b_dial(
                     caller=a_chan.as_namedtuple(),
                     targets=[channel.as_namedtuple()],
@@ -558,27 +613,32 @@ class EventHandler(object):
             # We'll want to send one ringing event for all targets, so send
             # one notification and mark the rest as already notified.
             open_dials = a_chan.get_dialed_channels()
-            targets = [dial.as_namedtuple() for dial in open_dials]
 
-            if not a_chan.has_extension:
+            # The error payloads convert channels to SimpleChannels, so only
+            # build them if the error will actually be logged.
+            if (
+                    not a_chan.has_extension and
+                    self._logger.isEnabledFor(logging.ERROR)
+            ):
                 self._logger.error(
-                    'Caller (Dial) did not have an extension: {}'.format({
+                    'Caller (Dial) did not have an extension: %s', {
                         'caller': a_chan.as_namedtuple(),
                         'destination': channel.as_namedtuple(),
-                    }))
+                    })
 
-            if not targets:
+            if not open_dials and self._logger.isEnabledFor(logging.ERROR):
                 self._logger.error(
                     'Caller (Dial) did not have any dialed channels: '
-                    '{}'.format({
+                    '%s', {
                         'caller': a_chan.as_namedtuple(),
                         'destination': channel.as_namedtuple(),
-                    }))
+                    })
 
-            self._reporter.on_b_dial(
-                caller=a_chan.as_namedtuple(),
-                targets=targets,
-            )
+            if self._reports_b_dial:
+                self._reporter.on_b_dial(
+                    caller=a_chan.as_namedtuple(),
+                    targets=[dial.as_namedtuple() for dial in open_dials],
+                )
 
             for b_chan in open_dials:
                 if b_chan != channel:
@@ -608,7 +668,7 @@ class EventHandler(object):
             # There are not enough interesting channels to form a call.
             return
 
-        callers = set([peer for peer in sip_peers if peer.is_calling])
+        callers = {peer for peer in sip_peers if peer.is_calling}
         targets = sip_peers - callers
 
         if len(callers) > 1:
@@ -626,16 +686,16 @@ class EventHandler(object):
                 non_caller.is_calling = False
         elif len(callers) < 1:
             # A call should always have a caller.
-            self._logger.warning('Call {} has too few callers: {}'.format(
-                channel.linkedid, len(callers)))
+            self._logger.warning('Call %s has too few callers: %d',
+                                 channel.linkedid, len(callers))
             return
         else:
             caller = next(iter(callers))
 
         if len(targets) != 1:
             # This can happen with a conference call, but is not supported.
-            self._logger.warning('Call {} has {} targets.'.format(
-                channel.linkedid, len(targets)))
+            self._logger.warning('Call %s has %d targets.',
+                                 channel.linkedid, len(targets))
             return
         else:
             target = next(iter(targets))
@@ -682,7 +742,7 @@ class EventHandler(object):
             if len(target_bridge) < 2:
                 self._logger.warning(
                     'Attn Xfer DestBridge does not have enough peers for '
-                    'event: {!r}'.format(event))
+                    'event: %r', event)
                 return
 
             peer_one, peer_two = target_bridge.peers
@@ -730,7 +790,7 @@ class EventHandler(object):
         if not transferee.has_extension:
             self._logger.error(
                 'Transferee (attn xfer) did not have an extension: '
-                '{}'.format(transferee))
+                '%s', transferee)
 
         # In some transfer scenarios, a caller can become a target. Because
         # of that, we need to make sure the target is not marked as calling.
@@ -820,7 +880,7 @@ class EventHandler(object):
         if not transferee.has_extension:
             self._logger.error(
                 'Transferee (blonde xfer) did not have an extension: '
-                '{}'.format(transferee))
+                '%s', transferee)
 
         targets = second_transferer.get_dialed_channels().union(
             transferee.get_dialed_channels())
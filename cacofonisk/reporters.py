@@ -147,18 +147,6 @@ class LoggingReporter(BaseReporter):
         """
         pass
 
-    def on_event(self, event):
-        """
-        Called after the regular even processing has been done.
-
-        Useful when custom event processing is required in addition to
-        regular event processing.
-
-        Args:
-            event (Message): Dict-like object with all attributes in the event.
-        """
-        pass
-
     def on_b_dial(self, caller, targets):
         """
         Gets invoked when the B side of a call is initiated.
@@ -171,8 +159,8 @@ class LoggingReporter(BaseReporter):
             caller (SimpleChannel): The initiator of the call.
             targets (list): The recipients of the call.
         """
-        self._logger.info('{} ringing: {} --> {} ({})'.format(
-            caller.linkedid, caller, caller.exten, targets))
+        self._logger.info('%s ringing: %s --> %s (%s)',
+                          caller.linkedid, caller, caller.exten, targets)
 
     def on_up(self, caller, target):
         """
@@ -186,8 +174,8 @@ class LoggingReporter(BaseReporter):
             caller (SimpleChannel): The initiator of the call.
             target (SimpleChannel): The recipient of the call.
         """
-        self._logger.info('{} up: {} --> {} ({})'.format(
-            caller.linkedid, caller, caller.exten, target))
+        self._logger.info('%s up: %s --> %s (%s)',
+                          caller.linkedid, caller, caller.exten, target)
 
     def on_attended_transfer(self, caller, transferer, target):
         """
@@ -204,9 +192,9 @@ class LoggingReporter(BaseReporter):
             target (SimpleChannel): The party which received the transfer.
         """
         self._logger.info(
-            '{} <== {} attn xfer: {} <--> {} (through {})'.format(
-                caller.linkedid, transferer.linkedid,
-                caller, target, transferer))
+            '%s <== %s attn xfer: %s <--> %s (through %s)',
+            caller.linkedid, transferer.linkedid,
+            caller, target, transferer)
 
     def on_blonde_transfer(self, caller, transferer, targets):
         """
@@ -222,9 +210,9 @@ class LoggingReporter(BaseReporter):
             targets (list): The channels being dialed.
         """
         self._logger.info(
-            '{} <== {} blonde xfer: {} <--> {} (through {})'.format(
-                caller.linkedid, transferer.linkedid, caller, targets,
-                transferer))
+            '%s <== %s blonde xfer: %s <--> %s (through %s)',
+            caller.linkedid, transferer.linkedid, caller, targets,
+            transferer)
 
     def on_blind_transfer(self, caller, transferer, targets):
         """
@@ -239,8 +227,8 @@ class LoggingReporter(BaseReporter):
             transferer (SimpleChannel): The party initiating the transfer.
             targets (list): The channels being dialed.
         """
-        self._logger.info('{} bld xfer: {} <--> {} (through {})'.format(
-            caller.linkedid, caller, targets, transferer))
+        self._logger.info('%s bld xfer: %s <--> %s (through %s)',
+                          caller.linkedid, caller, targets, transferer)
 
     def on_user_event(self, caller, event):
         """
@@ -253,7 +241,7 @@ class LoggingReporter(BaseReporter):
         Args:
             event (Message): Dict-like object with all attributes in the event.
         """
-        self._logger.info('{} user_event: {}'.format(event['Linkedid'], event))
+        self._logger.info('%s user_event: %s', event['Linkedid'], event)
 
     def on_hangup(self, caller, reason):
         """
@@ -263,8 +251,8 @@ class LoggingReporter(BaseReporter):
             caller (SimpleChannel): The initiator of the call.
             reason (str): A textual reason as to why the call was ended.
         """
-        self._logger.info('{} hangup: {} --> {} (reason: {})'.format(
-            caller.linkedid, caller, caller.exten, reason))
+        self._logger.info('%s hangup: %s --> %s (reason: %s)',
+                          caller.linkedid, caller, caller.exten, reason)
 
 
 class MultiReporter(LoggingReporter):
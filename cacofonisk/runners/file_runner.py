@@ -57,11 +57,16 @@ class FileRunner(object):
             events = self._load_events_from_disk(filename)
             channel_manager = self.channel_manager_class(
                 reporter=self.reporter)
-            interesting_events = channel_manager.event_handlers().keys()
+            if channel_manager.FILTER_EVENTS:
+                interesting_events = frozenset(
+                    channel_manager.event_handlers())
+            else:
+                # None means all events are passed to the channel manager.
+                interesting_events = None
 
             for event in events:
                 if (
-                        not channel_manager.FILTER_EVENTS or
+                        interesting_events is None or
                         event['Event'] in interesting_events
                    ):
                     channel_manager.on_event(event)
@@ -0,0 +1,43 @@
+from unittest import TestCase
+
+from cacofonisk.callerid import CallerId
+
+
+class CallerIdTestCase(TestCase):
+
+    def test_unknown_is_empty(self):
+        caller_id = CallerId(name='<unknown>', num='<unknown>')
+        self.assertEqual(CallerId(), caller_id)
+
+    def test_replace(self):
+        caller_id = CallerId(name='Andrew Garza', num='201')
+        replaced = caller_id.replace(num='202')
+
+        self.assertEqual(CallerId(name='Andrew Garza', num='202'), replaced)
+        self.assertEqual(CallerId(name='Andrew Garza', num='201'), caller_id)
+
+    def test_replace_unknown(self):
+        caller_id = CallerId(name='Andrew Garza', num='201')
+        replaced = caller_id.replace(name='<unknown>')
+
+        self.assertEqual(CallerId(num='201'), replaced)
+
+    def test_replace_unchanged(self):
+        caller_id = CallerId(name='Andrew Garza', num='201')
+
+        self.assertIs(caller_id, caller_id.replace(name='Andrew Garza'))
+        self.assertIs(caller_id, caller_id.replace(
+            name='Andrew Garza', num='201'))
+
+    def test_no_instance_dict(self):
+        caller_id = CallerId(name='Andrew Garza', num='201')
+        self.assertFalse(hasattr(caller_id, '__dict__'))
+
+    def test_replace_unknown_field(self):
+        caller_id = CallerId(name='Andrew Garza', num='201')
+
+        with self.assertRaises(ValueError):
+            caller_id.replace(number='202')
+
+        with self.assertRaises(ValueError):
+            caller_id.replace(name='Andrew Garza', number='201')
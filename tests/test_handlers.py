@@ -0,0 +1,246 @@
+import os
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from cacofonisk import BaseReporter, EventHandler
+from cacofonisk.runners.file_runner import FileRunner
+
+
+class EventHandlerDialTestCase(TestCase):
+    """
+    Test how EventHandler tracks dials between channels.
+    """
+
+    def setUp(self):
+        self.handler = EventHandler(reporter=BaseReporter())
+
+    def new_channel(self, name, uniqueid, linkedid, state=0):
+        self.handler.on_event({
+            'Event': 'Newchannel',
+            'Channel': name,
+            'Uniqueid': uniqueid,
+            'Linkedid': linkedid,
+            'ChannelState': str(state),
+            'Exten': '202',
+            'AccountCode': '150010001',
+            'CallerIDName': '<unknown>',
+            'CallerIDNum': '<unknown>',
+            'ConnectedLineName': '<unknown>',
+            'ConnectedLineNum': '<unknown>',
+        })
+        return self.handler._channels[uniqueid]
+
+    def dial(self, event_name, channel, destination):
+        self.handler.on_event({
+            'Event': event_name,
+            'Uniqueid': channel.uniqueid,
+            'DestUniqueid': destination.uniqueid,
+        })
+
+    def test_fwd_dials_order(self):
+        a_chan = self.new_channel('SIP/150010001-00000001', 'a.1', 'a.1')
+        b_chan = self.new_channel('SIP/150010002-00000002', 'b.2', 'a.1')
+        c_chan = self.new_channel('SIP/150010003-00000003', 'c.3', 'a.1')
+
+        self.dial('DialBegin', a_chan, b_chan)
+        self.dial('DialBegin', a_chan, c_chan)
+        self.assertEqual([b_chan, c_chan], list(a_chan.fwd_dials))
+
+        self.dial('DialEnd', a_chan, b_chan)
+        self.assertEqual([c_chan], list(a_chan.fwd_dials))
+        self.assertIsNone(b_chan.back_dial)
+
+    def test_hangup_before_dial_end(self):
+        a_chan = self.new_channel('SIP/150010001-00000001', 'a.1', 'a.1')
+        b_chan = self.new_channel('SIP/150010002-00000002', 'b.2', 'a.1')
+        c_chan = self.new_channel('SIP/150010003-00000003', 'c.3', 'a.1')
+
+        self.dial('DialBegin', a_chan, b_chan)
+        self.dial('DialBegin', a_chan, c_chan)
+
+        # B hangs up while its dial is still open.
+        self.handler.on_event({
+            'Event': 'Hangup',
+            'Uniqueid': b_chan.uniqueid,
+            'Cause': '21',
+        })
+
+        self.assertEqual({c_chan}, a_chan.get_dialed_channels())
+
+        # The late DialEnd refers to a channel which no longer exists.
+        with self.assertLogs('cacofonisk.handlers', 'WARNING') as logs:
+            self.dial('DialEnd', a_chan, b_chan)
+
+        self.assertEqual(1, len(logs.output))
+        self.assertIn('Channel with Uniqueid b.2 not in mem', logs.output[0])
+        self.assertEqual({c_chan}, a_chan.get_dialed_channels())
+
+    def test_caller_hangup_before_dial_end(self):
+        a_chan = self.new_channel('SIP/150010001-00000001', 'a.1', 'a.1')
+        b_chan = self.new_channel('SIP/150010002-00000002', 'b.2', 'a.1')
+
+        self.dial('DialBegin', a_chan, b_chan)
+
+        # A hangs up while its dial to B is still open.
+        self.handler.on_event({
+            'Event': 'Hangup',
+            'Uniqueid': a_chan.uniqueid,
+            'Cause': '16',
+        })
+
+        self.assertIsNone(b_chan.back_dial)
+        self.assertIs(b_chan, b_chan.get_dialing_channel())
+
+    def test_dialing_channel_loop(self):
+        a_chan = self.new_channel('SIP/150010001-00000001', 'a.1', 'a.1')
+        b_chan = self.new_channel('SIP/150010002-00000002', 'b.2', 'a.1')
+
+        # Nothing rejects dials which link the channels in a loop.
+        self.dial('DialBegin', a_chan, b_chan)
+        self.dial('DialBegin', b_chan, a_chan)
+
+        with self.assertRaises(AssertionError):
+            b_chan.get_dialing_channel()
+
+
+    def test_originate_bridge_without_non_local_peers(self):
+        reporter = MagicMock(spec=BaseReporter)
+        self.handler = EventHandler(reporter=reporter)
+
+        local_one = self.new_channel(
+            'Local/201@ctx-00000001;1', 'l1.1', 'l1.1')
+        local_two = self.new_channel(
+            'Local/201@ctx-00000001;2', 'l2.2', 'l1.1')
+        other_local = self.new_channel(
+            'Local/202@ctx-00000002;1', 'l3.3', 'l3.3')
+        b_chan = self.new_channel('SIP/150010002-00000004', 'b.4', 'l1.1')
+
+        self.handler.on_event({
+            'Event': 'LocalBridge',
+            'LocalOneUniqueid': local_one.uniqueid,
+            'LocalTwoUniqueid': local_two.uniqueid,
+        })
+        # An Originate dials the first semi channel without a source.
+        self.handler.on_event({
+            'Event': 'DialBegin',
+            'DestUniqueid': local_one.uniqueid,
+        })
+        self.dial('DialBegin', local_one, b_chan)
+
+        # The other semi channel ends up in a bridge with only Local peers.
+        self.handler.on_event({
+            'Event': 'BridgeCreate',
+            'BridgeUniqueid': 'bridge.1',
+            'BridgeType': 'basic',
+            'BridgeTechnology': 'simple_bridge',
+            'BridgeCreator': '<unknown>',
+            'BridgeVideoSourceMode': 'none',
+        })
+        for channel in (local_two, other_local):
+            self.handler.on_event({
+                'Event': 'BridgeEnter',
+                'Uniqueid': channel.uniqueid,
+                'BridgeUniqueid': 'bridge.1',
+            })
+
+        with self.assertLogs('cacofonisk.handlers', 'ERROR') as logs:
+            self.handler.on_event({
+                'Event': 'Newstate',
+                'Uniqueid': b_chan.uniqueid,
+                'ChannelState': '5',
+            })
+
+        self.assertEqual(1, len(logs.output))
+        self.assertIn(
+            'Caller (Originate) bridge has no non-Local channels',
+            logs.output[0])
+        reporter.on_b_dial.assert_not_called()
+
+
+class EventHandlerReporterTestCase(TestCase):
+
+    def test_on_event_forwarded(self):
+        reporter = MagicMock(spec=BaseReporter)
+        handler = EventHandler(reporter=reporter)
+
+        event = {'Event': 'Cdr'}
+        handler.on_event(event)
+        reporter.on_event.assert_called_once_with(event)
+
+    def test_on_event_overridden(self):
+        class EventReporter(BaseReporter):
+            def __init__(self):
+                self.events = []
+
+            def on_event(self, event):
+                self.events.append(event)
+
+        reporter = EventReporter()
+        handler = EventHandler(reporter=reporter)
+
+        event = {'Event': 'Cdr'}
+        handler.on_event(event)
+        self.assertEqual([event], reporter.events)
+
+
+class IgnoreFlagEventHandler(EventHandler):
+    """
+    EventHandler which records the channels marked with ignore_b_dial.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(IgnoreFlagEventHandler, self).__init__(*args, **kwargs)
+        self.ignored_channels = set()
+
+    def on_b_dial_ringing(self, channel):
+        super(IgnoreFlagEventHandler, self).on_b_dial_ringing(channel)
+
+        for chan in self._channels.values():
+            if 'ignore_b_dial' in chan.custom:
+                self.ignored_channels.add(chan.name)
+
+
+class EventHandlerBDialTestCase(TestCase):
+    """
+    Test on_b_dial is only built and sent to reporters which implement it.
+    """
+
+    def replay(self, reporter):
+        filename = os.path.join(
+            os.path.dirname(__file__), 'fixtures/simple/ab_callgroup.json')
+
+        runner = FileRunner(
+            [filename], reporter=reporter,
+            channel_manager_class=IgnoreFlagEventHandler)
+        runner.run()
+
+        assert len(runner.channel_managers) == 1
+        return runner.channel_managers[0]
+
+    def test_on_b_dial_not_implemented(self):
+        with patch.object(
+                BaseReporter, 'on_b_dial', autospec=True) as on_b_dial:
+            handler = self.replay(BaseReporter())
+
+        on_b_dial.assert_not_called()
+        self.assertEqual(
+            {'SIP/150010003-0000000f'}, handler.ignored_channels)
+
+    def test_on_b_dial_implemented(self):
+        class BDialReporter(BaseReporter):
+            def __init__(self):
+                self.events = []
+
+            def on_b_dial(self, caller, targets):
+                self.events.append((caller.name, sorted(
+                    target.name for target in targets)))
+
+        reporter = BDialReporter()
+        handler = self.replay(reporter)
+
+        self.assertEqual([(
+            'SIP/150010001-0000000d',
+            ['SIP/150010002-0000000e', 'SIP/150010003-0000000f'],
+        )], reporter.events)
+        self.assertEqual(
+            {'SIP/150010003-0000000f'}, handler.ignored_channels)